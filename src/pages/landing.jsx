@@ -1,4 +1,4 @@
-import React, { useState, useRef, useEffect } from "react";
+import React, { useState, useRef, useEffect, useMemo } from "react";
 import {
   Send,
   Bot,
@@ -29,13 +29,162 @@ import {
   CollapsibleTrigger,
 } from "@/components/ui/collapsible";
 
+// Greeting shown as the first bot message
+const WELCOME_MESSAGE =
+  "Hello! I'm your AI agent powered by Gemini LLM and Firecrawl tools. I can help you search the web, scrape content, extract data, and provide intelligent responses. What would you like to know?";
+
+// Tools shown when the backend /tools endpoint can't be reached
+const FALLBACK_TOOLS = [
+  "firecrawl_scrape",
+  "firecrawl_map",
+  "firecrawl_crawl",
+  "firecrawl_check_crawl_status",
+  "firecrawl_search",
+  "firecrawl_extract",
+  "firecrawl_deep_research",
+  "firecrawl_generate_llmstxt",
+];
+
+// Longest message the input accepts, matching the backend's own truncation.
+// The browser stops input at this length, so the UI says when it's reached.
+const MAX_MESSAGE_LENGTH = 175000;
+
+// How often to ping /health while the page is open. Render idles the backend
+// after ~15 minutes without traffic, and waking it can take close to a minute.
+const KEEPALIVE_INTERVAL_MS = 10 * 60 * 1000;
+
+// Stop pinging once the user has been idle this long, so a forgotten tab
+// doesn't keep the backend from ever idling.
+const KEEPALIVE_IDLE_MS = 30 * 60 * 1000;
+
+// Time of the last request any open tab made to the backend. Kept in
+// localStorage so tabs share it and only one of them needs to ping.
+const LAST_BACKEND_REQUEST_KEY = "simple-agent:lastBackendRequest";
+
+const noteBackendRequest = () => {
+  try {
+    localStorage.setItem(LAST_BACKEND_REQUEST_KEY, String(Date.now()));
+  } catch {
+    // Storage unavailable (e.g. privacy mode); tabs just ping independently
+  }
+};
+
+const msSinceBackendRequest = () => {
+  try {
+    const last = Number(localStorage.getItem(LAST_BACKEND_REQUEST_KEY));
+    return last ? Date.now() - last : Infinity;
+  } catch {
+    return Infinity;
+  }
+};
+
+// Best-effort GET /health; chat requests report their own errors
+const pingBackend = (backendURL) => {
+  noteBackendRequest();
+  fetch(`${backendURL}/health`, {
+    method: "GET",
+    signal: AbortSignal.timeout(10000), // 10 second timeout
+  }).catch(() => {});
+};
+
+// Backend URL - automatically detects environment
+const getBackendURL = () => {
+  // Check if we're in development (localhost)
+  if (
+    window.location.hostname === "localhost" ||
+    window.location.hostname === "127.0.0.1"
+  ) {
+    return "http://localhost:5000";
+  }
+  // Deployed backend URL from .env; vite.config.js refuses to run without it
+  // and adds the matching preconnect hint to production builds
+  return import.meta.env.VITE_BACKEND_URL;
+};
+
+// Tool name keyword -> icon, checked in order (first match wins).
+// Icons are created once and shared, since React elements are immutable.
+const TOOL_ICONS = [
+  ["search", <Search className="w-3 h-3" />],
+  ["scrape", <Globe className="w-3 h-3" />],
+  ["extract", <FileText className="w-3 h-3" />],
+  ["crawl", <Database className="w-3 h-3" />],
+];
+const DEFAULT_TOOL_ICON = <Zap className="w-3 h-3" />;
+
+// Returns the appropriate Lucide icon for a given tool
+const getToolIcon = (tool) => {
+  const entry = TOOL_ICONS.find(([keyword]) => tool.includes(keyword));
+  return entry ? entry[1] : DEFAULT_TOOL_ICON;
+};
+
+// Renders formatted message content. Memoized and defined outside
+// LandingPage so existing messages are not re-rendered (or remounted)
+// on every keystroke in the chat input.
+const MessageContent = React.memo(function MessageContent({ content }) {
+  // Split content by line breaks and render with proper formatting
+  const lines = content.split("\n");
+
+  return (
+    <div className="space-y-2">
+      {lines.map((line, index) => {
+        const trimmed = line.trim();
+
+        // Skip empty lines
+        if (!trimmed) return <div key={index} className="h-2" />;
+
+        // Handle bullet points
+        if (trimmed.startsWith("•")) {
+          return (
+            <div key={index} className="flex items-start gap-2">
+              <span className="text-blue-500 font-bold">•</span>
+              <span
+                className="flex-1"
+                dangerouslySetInnerHTML={{
+                  __html: line
+                    .replace("•", "")
+                    .trim()
+                    .replace(/\*\*(.*?)\*\*/g, "<strong>$1</strong>"),
+                }}
+              />
+            </div>
+          );
+        }
+
+        // Handle bold headings
+        if (trimmed.endsWith("**")) {
+          return (
+            <div
+              key={index}
+              className="font-bold text-lg mt-3 mb-1"
+              dangerouslySetInnerHTML={{
+                __html: line.replace(/\*\*(.*?)\*\*/g, "$1"),
+              }}
+            />
+          );
+        }
+
+        // Regular line with bold formatting
+        return (
+          <p
+            key={index}
+            className="leading-relaxed"
+            dangerouslySetInnerHTML={{
+              __html: line.replace(/\*\*(.*?)\*\*/g, "<strong>$1</strong>"),
+            }}
+          />
+        );
+      })}
+    </div>
+  );
+});
+
 function LandingPage({ onNavigate }) {
-  const [messages, setMessages] = useState([
+  // Lazy initializer so the welcome message is only built on first render
+  const [messages, setMessages] = useState(() => [
     {
       id: 1,
       type: "bot",
-      content:
-        "Hello! I'm your AI agent powered by Gemini LLM and Firecrawl tools. I can help you search the web, scrape content, extract data, and provide intelligent responses. What would you like to know?",
+      content: WELCOME_MESSAGE,
       timestamp: new Date().toLocaleTimeString(),
     },
   ]);
@@ -48,22 +197,14 @@ function LandingPage({ onNavigate }) {
 
   const messagesEndRef = useRef(null);
   const inputRef = useRef(null);
-
-  // Backend URL - automatically detects environment
-  const getBackendURL = () => {
-    // Check if we're in development (localhost)
-    if (
-      window.location.hostname === "localhost" ||
-      window.location.hostname === "127.0.0.1"
-    ) {
-      return "http://localhost:5000";
-    }
-    // Production backend URL
-    return "https://simple-agent-backend.onrender.com";
-  };
+  // Time of the last keystroke or send, used to pause the keepalive ping
+  const lastActivityRef = useRef(Date.now());
 
   const BACKEND_URL = getBackendURL();
 
+  // Computed once per render and shared by the Send button and handleSubmit
+  const hasInput = inputValue.trim().length > 0;
+
   // Function to format AI responses for better readability
   const formatAIResponse = (content) => {
     // If content is already well-formatted (contains bullet points, line breaks, etc.), return as is
@@ -75,22 +216,18 @@ function LandingPage({ onNavigate }) {
       return content;
     }
 
+    // Short replies are left alone; skip splitting them into sentences
+    if (content.length <= 300) {
+      return content;
+    }
+
     // For lengthy paragraphs, try to break them up
     const sentences = content
       .split(/[.!?]+/)
       .filter((s) => s.trim().length > 0);
 
     // If it's a long paragraph with multiple sentences, format it better
-    if (sentences.length > 3 && content.length > 300) {
-      // Look for patterns that suggest lists or multiple items
-      const listPatterns = [
-        /\*\*([^*]+)\*\*/g, // Bold items
-        /(\w+\.com|\w+\.org|\w+\.ai)/g, // Website mentions
-        /([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[:–-]/g, // Title patterns
-      ];
-
-      let formatted = content;
-
+    if (sentences.length > 3) {
       // Try to identify and format website/platform mentions
       const websiteMatches = content.match(
         /(\w+\.com|\w+\.org|\w+\.ai|\w+Face|\w+Net|[A-Z][a-z]+[A-Z][a-z]+)/g
@@ -159,16 +296,7 @@ function LandingPage({ onNavigate }) {
       console.error("Error fetching available tools:", error);
       setToolsError(error.message);
       // Fallback to hardcoded tools if fetch fails
-      setAvailableTools([
-        "firecrawl_scrape",
-        "firecrawl_map",
-        "firecrawl_crawl",
-        "firecrawl_check_crawl_status",
-        "firecrawl_search",
-        "firecrawl_extract",
-        "firecrawl_deep_research",
-        "firecrawl_generate_llmstxt",
-      ]);
+      setAvailableTools(FALLBACK_TOOLS);
     } finally {
       setToolsLoading(false);
     }
@@ -179,6 +307,22 @@ function LandingPage({ onNavigate }) {
     fetchAvailableTools();
   }, []);
 
+  // Keep the backend warm while the user is typing or has recently chatted,
+  // so the next message doesn't pay the cold-start delay. Skipped for
+  // background tabs, once the user has been idle for KEEPALIVE_IDLE_MS, and
+  // when any tab reached the backend within the last interval.
+  useEffect(() => {
+    const intervalId = setInterval(() => {
+      if (document.visibilityState === "hidden") return;
+      if (Date.now() - lastActivityRef.current >= KEEPALIVE_IDLE_MS) return;
+      if (msSinceBackendRequest() < KEEPALIVE_INTERVAL_MS) return;
+
+      pingBackend(BACKEND_URL);
+    }, KEEPALIVE_INTERVAL_MS);
+
+    return () => clearInterval(intervalId);
+  }, [BACKEND_URL]);
+
   // Scrolls to the bottom of the messages container
   const scrollToBottom = () => {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
@@ -191,7 +335,10 @@ function LandingPage({ onNavigate }) {
 
   // Handles the submission of a user message and communicates with the backend
   const handleSubmit = async () => {
-    if (!inputValue.trim() || isLoading) return;
+    if (!hasInput || isLoading) return;
+
+    lastActivityRef.current = Date.now();
+    noteBackendRequest();
 
     const userMessage = {
       id: Date.now(),
@@ -205,14 +352,15 @@ function LandingPage({ onNavigate }) {
     setIsLoading(true);
 
     try {
-      // Prepare chat history to send to backend
-      const historyToSend = messages.map((msg) => ({
-        type: msg.type,
-        content: msg.content,
-      }));
-
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 180000); // 3 minute timeout
+      // Prepare chat history to send to backend. Failed exchanges (the
+      // unanswered prompt and its error notice) are left out, so history
+      // only holds prompts the backend actually answered.
+      const historyToSend = messages
+        .filter((msg) => !msg.omitFromHistory)
+        .map((msg) => ({
+          type: msg.type,
+          content: msg.content,
+        }));
 
       const response = await fetch(`${BACKEND_URL}/chat`, {
         method: "POST",
@@ -223,11 +371,10 @@ function LandingPage({ onNavigate }) {
           message: userMessage.content,
           history: historyToSend,
         }),
-        signal: controller.signal,
+        // Timer is owned by the signal, so it is released on every exit path
+        signal: AbortSignal.timeout(180000), // 3 minute timeout
       });
 
-      clearTimeout(timeoutId);
-
       if (!response.ok) {
         // Handle different HTTP error codes
         if (response.status === 503) {
@@ -248,9 +395,10 @@ function LandingPage({ onNavigate }) {
       let botMessageContent = data.ai_message || "(No direct textual response)";
       let toolsUsedByBot = [];
 
-      // Process tool_calls and tool_outputs if present
+      // Process tool_calls and tool_outputs if present; a tool the agent
+      // called several times is listed once
       if (data.tool_calls && data.tool_calls.length > 0) {
-        toolsUsedByBot = data.tool_calls.map((tc) => tc.name);
+        toolsUsedByBot = [...new Set(data.tool_calls.map((tc) => tc.name))];
       }
 
       // Format the AI response for better readability
@@ -270,7 +418,7 @@ function LandingPage({ onNavigate }) {
 
       let errorMessage = "⚠️ **Connection Error**\n\n";
 
-      if (error.name === "AbortError") {
+      if (error.name === "TimeoutError" || error.name === "AbortError") {
         errorMessage +=
           "Request timed out. The server might be busy.\n• Try a simpler question\n• Wait a moment and try again\n• Check your internet connection";
       } else if (error.message.includes("Service is starting up")) {
@@ -287,12 +435,15 @@ function LandingPage({ onNavigate }) {
       }
 
       setMessages((prev) => [
-        ...prev,
+        ...prev.map((msg) =>
+          msg.id === userMessage.id ? { ...msg, omitFromHistory: true } : msg
+        ),
         {
           id: Date.now() + 1,
           type: "bot",
           content: errorMessage,
           timestamp: new Date().toLocaleTimeString(),
+          omitFromHistory: true,
         },
       ]);
     } finally {
@@ -300,71 +451,26 @@ function LandingPage({ onNavigate }) {
     }
   };
 
-  // Returns the appropriate Lucide icon for a given tool
-  const getToolIcon = (tool) => {
-    if (tool.includes("search")) return <Search className="w-3 h-3" />;
-    if (tool.includes("scrape")) return <Globe className="w-3 h-3" />;
-    if (tool.includes("extract")) return <FileText className="w-3 h-3" />;
-    if (tool.includes("crawl")) return <Database className="w-3 h-3" />;
-    return <Zap className="w-3 h-3" />;
-  };
-
-  // Component to render formatted message content
-  const MessageContent = ({ content }) => {
-    // Split content by line breaks and render with proper formatting
-    const lines = content.split("\n");
-
-    return (
-      <div className="space-y-2">
-        {lines.map((line, index) => {
-          // Skip empty lines
-          if (!line.trim()) return <div key={index} className="h-2" />;
-
-          // Handle bullet points
-          if (line.trim().startsWith("•")) {
-            return (
-              <div key={index} className="flex items-start gap-2">
-                <span className="text-blue-500 font-bold">•</span>
-                <span
-                  className="flex-1"
-                  dangerouslySetInnerHTML={{
-                    __html: line
-                      .replace("•", "")
-                      .trim()
-                      .replace(/\*\*(.*?)\*\*/g, "<strong>$1</strong>"),
-                  }}
-                />
-              </div>
-            );
-          }
-
-          // Handle bold headings
-          if (line.includes("**") && line.trim().endsWith("**")) {
-            return (
-              <div
-                key={index}
-                className="font-bold text-lg mt-3 mb-1"
-                dangerouslySetInnerHTML={{
-                  __html: line.replace(/\*\*(.*?)\*\*/g, "$1"),
-                }}
-              />
-            );
-          }
-
-          // Regular line with bold formatting
-          return (
-            <p
-              key={index}
-              className="leading-relaxed"
-              dangerouslySetInnerHTML={{
-                __html: line.replace(/\*\*(.*?)\*\*/g, "<strong>$1</strong>"),
-              }}
-            />
-          );
-        })}
-      </div>
-    );
-  };
+  // Tool chips only change when the tool list is (re)fetched, so build them
+  // once per fetch instead of on every keystroke in the chat input
+  const toolChips = useMemo(
+    () =>
+      availableTools.map((tool, index) => (
+        <span
+          key={index}
+          className={cn(
+            "px-2 py-1 rounded text-xs font-mono flex items-center gap-1",
+            toolsError
+              ? "bg-amber-500/20 text-amber-200"
+              : "bg-purple-500/20 text-purple-200"
+          )}
+        >
+          {getToolIcon(tool)}
+          {tool}
+        </span>
+      )),
+    [availableTools, toolsError]
+  );
 
   // Render tools section with loading and error states
   const renderToolsSection = () => {
@@ -406,30 +512,8 @@ function LandingPage({ onNavigate }) {
               <p className="text-xs text-purple-400">
                 Loading tools from backend...
               </p>
-            ) : toolsError ? (
-              <div className="flex flex-wrap gap-2">
-                {availableTools.map((tool, index) => (
-                  <span
-                    key={index}
-                    className="px-2 py-1 bg-amber-500/20 text-amber-200 rounded text-xs font-mono flex items-center gap-1"
-                  >
-                    {getToolIcon(tool)}
-                    {tool}
-                  </span>
-                ))}
-              </div>
             ) : (
-              <div className="flex flex-wrap gap-2">
-                {availableTools.map((tool, index) => (
-                  <span
-                    key={index}
-                    className="px-2 py-1 bg-purple-500/20 text-purple-200 rounded text-xs font-mono flex items-center gap-1"
-                  >
-                    {getToolIcon(tool)}
-                    {tool}
-                  </span>
-                ))}
-              </div>
+              <div className="flex flex-wrap gap-2">{toolChips}</div>
             )}
             <button
               onClick={fetchAvailableTools}
@@ -576,7 +660,17 @@ function LandingPage({ onNavigate }) {
               ref={inputRef}
               type="text"
               value={inputValue}
-              onChange={(e) => setInputValue(e.target.value)}
+              onChange={(e) => {
+                const now = Date.now();
+                // Returning after an idle stretch: wake the backend now,
+                // while the user is still typing, rather than on the next tick
+                if (now - lastActivityRef.current >= KEEPALIVE_IDLE_MS) {
+                  pingBackend(BACKEND_URL);
+                }
+                lastActivityRef.current = now;
+                setInputValue(e.target.value);
+              }}
+              maxLength={MAX_MESSAGE_LENGTH}
               onKeyPress={(e) => {
                 if (e.key === "Enter" && !e.shiftKey) {
                   e.preventDefault();
@@ -589,9 +683,9 @@ function LandingPage({ onNavigate }) {
             />
             <button
               onClick={handleSubmit}
-              disabled={!inputValue.trim() || isLoading}
+              disabled={!hasInput || isLoading}
               className={`px-6 py-3 rounded-2xl flex items-center gap-2 font-medium text-white transition-all duration-200 ${
-                isLoading || !inputValue.trim()
+                isLoading || !hasInput
                   ? "bg-gray-500/50 cursor-not-allowed"
                   : "bg-gradient-to-r from-purple-500 to-pink-500 hover:from-purple-600 hover:to-pink-600 cursor-pointer shadow-lg hover:shadow-purple-500/25"
               }`}
@@ -605,6 +699,16 @@ function LandingPage({ onNavigate }) {
             </button>
           </div>
 
+          {inputValue.length >= MAX_MESSAGE_LENGTH && (
+            <div className="mt-2 flex items-center justify-center gap-2 text-xs text-amber-400">
+              <AlertCircle className="w-4 h-4" />
+              <span>
+                Message limit reached ({MAX_MESSAGE_LENGTH.toLocaleString()}{" "}
+                characters)
+              </span>
+            </div>
+          )}
+
           <div className="mt-2 text-xs text-purple-400 text-center">
             Powered by Gemini LLM • Firecrawl Tools • Real-time Web Intelligence
             {window.location.hostname !== "localhost" && (
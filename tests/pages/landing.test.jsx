@@ -43,6 +43,8 @@ describe("LandingPage", () => {
   beforeEach(() => {
     vi.clearAllMocks();
     mockWindowLocation("localhost");
+    // Keepalive tabs share their last-request time through localStorage
+    localStorage.clear();
 
     // Create a mock for scrollIntoView
     window.HTMLElement.prototype.scrollIntoView = vi.fn();
@@ -270,6 +272,264 @@ describe("LandingPage", () => {
     });
   });
 
+  it("lists each tool used by the bot only once", async () => {
+    mockFetch
+      .mockImplementationOnce(() =>
+        Promise.resolve({
+          ok: true,
+          json: () => Promise.resolve({ tools: [] }),
+        })
+      )
+      .mockImplementationOnce(() =>
+        Promise.resolve({
+          ok: true,
+          json: () =>
+            Promise.resolve({
+              ai_message: "Scraped both pages.",
+              tool_calls: [
+                { name: "firecrawl_scrape" },
+                { name: "firecrawl_scrape" },
+                { name: "firecrawl_search" },
+              ],
+            }),
+        })
+      );
+
+    render(<LandingPage />);
+
+    fireEvent.change(
+      screen.getByPlaceholderText(
+        /Ask me anything... I can search, scrape, extract data, and more!/i
+      ),
+      { target: { value: "Scrape these" } }
+    );
+    fireEvent.click(screen.getByRole("button", { name: /Send/i }));
+
+    await waitFor(() => {
+      expect(screen.getByText("Tools Used:")).toBeInTheDocument();
+    });
+    expect(screen.getAllByText("firecrawl_scrape")).toHaveLength(1);
+    expect(screen.getAllByText("firecrawl_search")).toHaveLength(1);
+  });
+
+  it("shows a timeout notice when the chat request times out", async () => {
+    mockFetch
+      .mockImplementationOnce(() =>
+        Promise.resolve({
+          ok: true,
+          json: () => Promise.resolve({ tools: [] }),
+        })
+      )
+      .mockImplementationOnce(() =>
+        Promise.reject(new DOMException("timeout", "TimeoutError"))
+      );
+
+    render(<LandingPage />);
+
+    const input = screen.getByPlaceholderText(
+      /Ask me anything... I can search, scrape, extract data, and more!/i
+    );
+    const sendButton = screen.getByRole("button", { name: /Send/i });
+
+    fireEvent.change(input, { target: { value: "Slow question" } });
+    fireEvent.click(sendButton);
+
+    await waitFor(() => {
+      expect(screen.getByText(/Request timed out/i)).toBeInTheDocument();
+    });
+
+    // The timed-out prompt is flagged omitFromHistory, so it isn't resent
+    fireEvent.change(input, { target: { value: "Retry" } });
+    fireEvent.click(sendButton);
+
+    await waitFor(() => {
+      expect(
+        screen.getByText("This is a test AI response.")
+      ).toBeInTheDocument();
+    });
+
+    const lastChatCall = mockFetch.mock.calls
+      .filter(([url]) => url.endsWith("/chat"))
+      .at(-1);
+    const { history } = JSON.parse(lastChatCall[1].body);
+
+    expect(history.map((msg) => msg.content)).not.toContain("Slow question");
+    expect(
+      history.some((msg) => msg.content.includes("Request timed out"))
+    ).toBe(false);
+  });
+
+  it("omits failed exchanges from the history sent to the backend", async () => {
+    mockFetch
+      .mockImplementationOnce(() =>
+        Promise.resolve({
+          ok: true,
+          json: () => Promise.resolve({ tools: [] }),
+        })
+      )
+      .mockImplementationOnce(() =>
+        Promise.resolve({
+          ok: false,
+          status: 500,
+          json: () => Promise.resolve({}),
+        })
+      );
+
+    render(<LandingPage />);
+
+    const input = screen.getByPlaceholderText(
+      /Ask me anything... I can search, scrape, extract data, and more!/i
+    );
+    const sendButton = screen.getByRole("button", { name: /Send/i });
+
+    fireEvent.change(input, { target: { value: "First try" } });
+    fireEvent.click(sendButton);
+
+    await waitFor(() => {
+      expect(screen.getByText(/Connection Error/)).toBeInTheDocument();
+    });
+
+    fireEvent.change(input, { target: { value: "Second try" } });
+    fireEvent.click(sendButton);
+
+    await waitFor(() => {
+      expect(
+        screen.getByText("This is a test AI response.")
+      ).toBeInTheDocument();
+    });
+
+    const lastChatCall = mockFetch.mock.calls
+      .filter(([url]) => url.endsWith("/chat"))
+      .at(-1);
+    const { history } = JSON.parse(lastChatCall[1].body);
+
+    // Neither the unanswered prompt nor its error notice is sent, so the
+    // backend doesn't see two user turns in a row
+    expect(history).toEqual([
+      {
+        type: "bot",
+        content: expect.stringMatching(/^Hello! I'm your AI agent/),
+      },
+    ]);
+  });
+
+  it("limits the message input to the backend's maximum length", () => {
+    render(<LandingPage />);
+
+    expect(
+      screen.getByPlaceholderText(
+        /Ask me anything... I can search, scrape, extract data, and more!/i
+      )
+    ).toHaveAttribute("maxlength", "175000");
+    expect(screen.queryByText(/Message limit reached/i)).not.toBeInTheDocument();
+  });
+
+  it("warns when the message reaches the maximum length", () => {
+    render(<LandingPage />);
+
+    fireEvent.change(
+      screen.getByPlaceholderText(
+        /Ask me anything... I can search, scrape, extract data, and more!/i
+      ),
+      { target: { value: "a".repeat(175000) } }
+    );
+
+    expect(screen.getByText(/Message limit reached/i)).toBeInTheDocument();
+  });
+
+  const healthCalls = () =>
+    mockFetch.mock.calls.filter(([url]) => url.endsWith("/health")).length;
+
+  it("pings the backend health endpoint periodically to keep it warm", () => {
+    vi.useFakeTimers({ toFake: ["setInterval", "clearInterval", "Date"] });
+
+    try {
+      const { unmount } = render(<LandingPage />);
+
+      expect(healthCalls()).toBe(0);
+
+      vi.advanceTimersByTime(10 * 60 * 1000);
+
+      expect(mockFetch).toHaveBeenCalledWith(
+        "http://localhost:5000/health",
+        expect.objectContaining({ method: "GET" })
+      );
+
+      // The interval is cleared on unmount
+      unmount();
+      mockFetch.mockClear();
+      vi.advanceTimersByTime(10 * 60 * 1000);
+      expect(mockFetch).not.toHaveBeenCalled();
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it("stops the keepalive ping after 30 idle minutes and resumes on activity", () => {
+    vi.useFakeTimers({ toFake: ["setInterval", "clearInterval", "Date"] });
+
+    try {
+      render(<LandingPage />);
+
+      // Pings at 10 and 20 minutes of inactivity
+      vi.advanceTimersByTime(20 * 60 * 1000);
+      expect(healthCalls()).toBe(2);
+
+      // Idle for 30+ minutes: no further pings
+      vi.advanceTimersByTime(20 * 60 * 1000);
+      expect(healthCalls()).toBe(2);
+
+      // Typing after the idle window wakes the backend immediately
+      fireEvent.change(
+        screen.getByPlaceholderText(
+          /Ask me anything... I can search, scrape, extract data, and more!/i
+        ),
+        { target: { value: "Back again" } }
+      );
+      expect(healthCalls()).toBe(3);
+
+      // Further typing while active doesn't ping again
+      fireEvent.change(
+        screen.getByPlaceholderText(
+          /Ask me anything... I can search, scrape, extract data, and more!/i
+        ),
+        { target: { value: "Back again!" } }
+      );
+      expect(healthCalls()).toBe(3);
+
+      // ...and the regular interval pings resume
+      vi.advanceTimersByTime(10 * 60 * 1000);
+      expect(healthCalls()).toBe(4);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it("skips the keepalive ping when another tab reached the backend recently", () => {
+    vi.useFakeTimers({ toFake: ["setInterval", "clearInterval", "Date"] });
+
+    try {
+      render(<LandingPage />);
+
+      // Another tab talks to the backend 5 minutes in
+      vi.advanceTimersByTime(5 * 60 * 1000);
+      localStorage.setItem(
+        "simple-agent:lastBackendRequest",
+        String(Date.now())
+      );
+
+      // At 10 minutes that request is only 5 minutes old: no ping
+      vi.advanceTimersByTime(5 * 60 * 1000);
+      expect(healthCalls()).toBe(0);
+
+      // At 20 minutes it is 15 minutes old, so this tab pings
+      vi.advanceTimersByTime(10 * 60 * 1000);
+      expect(healthCalls()).toBe(1);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
   it("displays local status in development", async () => {
     mockWindowLocation("localhost");
     render(<LandingPage />);
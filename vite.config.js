@@ -1,19 +1,48 @@
 // vite.config.js
 import path from "path";
 import react from "@vitejs/plugin-react";
-import { defineConfig } from "vite";
+import { defineConfig, loadEnv } from "vite";
 
-export default defineConfig({
-  plugins: [react()],
+// Adds a preconnect hint for the backend origin to production builds, so
+// DNS/TCP/TLS setup overlaps with loading the bundle. Dev servers talk to
+// localhost and don't need a connection to the deployed backend.
+// crossorigin matches the credential-less CORS fetches made by the app.
+function backendPreconnect(backendURL) {
+  return {
+    name: "backend-preconnect",
+    apply: "build",
+    transformIndexHtml() {
+      return [
+        {
+          tag: "link",
+          attrs: { rel: "preconnect", href: backendURL, crossorigin: true },
+          injectTo: "head",
+        },
+      ];
+    },
+  };
+}
+
+export default defineConfig(({ mode }) => {
+  // VITE_BACKEND_URL is the single source for the deployed backend origin
+  // (see .env). Fail here rather than shipping requests to "undefined/chat".
+  const { VITE_BACKEND_URL } = loadEnv(mode, process.cwd());
+  if (!VITE_BACKEND_URL) {
+    throw new Error("VITE_BACKEND_URL is not set; define it in .env");
+  }
 
-  resolve: {
-    alias: {
-      "@": path.resolve(__dirname, "./src"),
+  return {
+    plugins: [react(), backendPreconnect(VITE_BACKEND_URL)],
+
+    resolve: {
+      alias: {
+        "@": path.resolve(__dirname, "./src"),
+      },
+    },
+    test: {
+      globals: true,
+      environment: "jsdom",
+      setupFiles: "./vitest.setup.js", // Path to your setup file
     },
-  },
-  test: {
-    globals: true,
-    environment: "jsdom",
-    setupFiles: "./vitest.setup.js", // Path to your setup file
-  },
+  };
 });